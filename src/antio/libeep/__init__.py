@@ -291,6 +291,28 @@ class InputCNT(BaseCNT):
             )
         return pyeep.get_trigger(self._handle, index)
 
+    def get_triggers(
+        self,
+    ) -> list[tuple[str, int, int, Optional[str], Optional[str], Optional[str]]]:
+        """Get all triggers (annotations) in the file.
+
+        Returns
+        -------
+        triggers : list of tuple of shape (6,)
+            List of all triggers, each tuple containing the same elements as
+            :meth:`~antio.libeep.InputCNT.get_trigger`.
+
+        Notes
+        -----
+        Compared to calling :meth:`~antio.libeep.InputCNT.get_trigger` in a loop, the
+        trigger count and index are validated only once.
+
+        .. versionadded: 0.5.0.
+        """
+        handle = self._handle
+        get_trigger = pyeep.get_trigger
+        return [get_trigger(handle, k) for k in range(self.get_trigger_count())]
+
 
 def read_cnt(fname: Union[str, Path]) -> InputCNT:
     """Read a CNT file.
@@ -305,7 +327,9 @@ def read_cnt(fname: Union[str, Path]) -> InputCNT:
     cnt : InputCNT
         An object representing the CNT file.
     """
-    fname = ensure_path(fname, must_exist=True)
-    if fname.suffix != ".cnt":
+    fname = ensure_path(fname, must_exist=False)
+    if fname.suffix != ".cnt":  # checked before hitting the filesystem
         raise RuntimeError(f"Unsupported file extension '{fname.suffix}'.")
+    if not fname.exists():
+        raise FileNotFoundError(f"The provided path '{fname}' does not exist.")
     return InputCNT(pyeep.read(str(fname)))
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from warnings import warn
 
 import numpy as np
 
 if TYPE_CHECKING:
     from datetime import date, datetime
-    from typing import Optional
+    from typing import Optional, Union
 
     from numpy.typing import NDArray
 
     from .libeep import InputCNT
 
+_UNITS: dict[str, float] = {"uv": 1e-6, "µv": 1e-6}
+_CHUNK_SIZE: int = 16384  # number of samples read from libeep per block
+
 
 def read_info(
     cnt: InputCNT,
@@ -38,14 +42,13 @@ def read_info(
         List of channel types.
         .. versionadded: 0.3.0.
     """
-    ch_names, ch_units, ch_refs, ch_status, ch_types = [], [], [], [], []
-    for k in range(cnt.get_channel_count()):
-        channel = cnt.get_channel(k)
-        ch_names.append(channel[0])
-        ch_units.append(channel[1].lower())  # always lower the unit for mapping
-        ch_refs.append(channel[2])
-        ch_status.append(channel[3])
-        ch_types.append(channel[4])
+    channels = [cnt.get_channel(k) for k in range(cnt.get_channel_count())]
+    if len(channels) == 0:
+        return [], [], [], [], []
+    ch_names, ch_units, ch_refs, ch_status, ch_types = (
+        list(elt) for elt in zip(*channels)
+    )
+    ch_units = [unit.lower() for unit in ch_units]  # always lower the unit for mapping
     return ch_names, ch_units, ch_refs, ch_status, ch_types
 
 
@@ -122,8 +125,12 @@ def read_meas_date(cnt: InputCNT) -> Optional[datetime]:
 
 
 def read_data(
-    cnt: InputCNT, first_samp: int = 0, last_samp: Optional[int] = None
-) -> NDArray[np.float64]:
+    cnt: InputCNT,
+    first_samp: int = 0,
+    last_samp: Optional[int] = None,
+    ch_units: Optional[list[str]] = None,
+    dtype: Union[str, np.dtype] = "float64",
+) -> NDArray[np.floating]:
     """Read the data array.
 
     Parameters
@@ -136,6 +143,15 @@ def read_data(
     last_samp : int
         End index.
         .. versionadded: 0.3.0.
+    ch_units : list of str | None
+        List of human-readable units for each channel. If provided, the data is scaled
+        to SI units, fused with the type cast in a single pass over the array.
+        .. versionadded: 0.5.0.
+    dtype : str | dtype
+        Either ``"float64"`` (default) or ``"float32"``, the native precision of the
+        samples stored by libeep. Using ``"float32"`` halves the memory footprint of
+        the output array.
+        .. versionadded: 0.5.0.
 
     Returns
     -------
@@ -144,11 +160,89 @@ def read_data(
 
     Notes
     -----
-    The type casting makes the output array writeable.
+    The output array is writeable and C-contiguous. The samples are read from libeep
+    block by block, bounding the intermediate float32 buffer to the block size
+    regardless of the recording length.
     """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Unsupported dtype '{dtype}', expected float32 or float64.")
     if last_samp is None:
         last_samp = cnt.get_sample_count()  # sample = (n_channels,)
-    return cnt.get_samples_as_nparray(first_samp, last_samp).astype("float64")
+    if first_samp < 0 or last_samp < 0:
+        raise RuntimeError(
+            f"Start/Stop index {first_samp}/{last_samp} cannot be negative."
+        )
+    # column vector of per-channel scaling factors, broadcast across samples
+    scales = None if ch_units is None else _unit_scales(ch_units)[:, np.newaxis]
+    data = np.empty((cnt.get_channel_count(), last_samp - first_samp), dtype=dtype)
+    for start in range(first_samp, last_samp, _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, last_samp)
+        samples = cnt.get_samples_as_nparray(start, stop)
+        block = data[:, start - first_samp : stop - first_samp]
+        if scales is None:
+            np.copyto(block, samples)
+        else:  # cast and scale in a single fused ufunc call
+            np.multiply(samples, scales, out=block)
+    return data
+
+
+def _unit_scales(ch_units: list[str]) -> NDArray[np.float64]:
+    """Get the per-channel scaling factors to SI units.
+
+    Parameters
+    ----------
+    ch_units : list of str
+        List of human-readable units for each channel.
+
+    Returns
+    -------
+    scales : array of shape (n_channels,)
+        The scaling factors, 1 for channels with an unrecognized unit.
+    """
+    scales = np.array([_UNITS.get(unit, 1.0) for unit in ch_units])
+    for unit in sorted(set(ch_units) - set(_UNITS)):
+        warn(
+            f"Unit {unit} not recognized, not scaling.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return scales
+
+
+def scale_data(data: NDArray[np.float64], ch_units: list[str]) -> None:
+    """Scale the data array to SI units based on the human-readable units.
+
+    Parameters
+    ----------
+    data : array of shape (n_channels, n_samples)
+        The data array to scale, modified in-place.
+    ch_units : list of str
+        List of human-readable units for each channel.
+
+    Notes
+    -----
+    Channels with an unrecognized unit are left untouched.
+
+    .. versionadded: 0.5.0.
+    """
+    units, inverse = np.unique(ch_units, return_inverse=True)
+    for k, unit in enumerate(units):
+        if unit not in _UNITS:
+            warn(
+                f"Unit {unit} not recognized, not scaling.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            continue
+        if units.size == 1:  # all channels share the same unit
+            data *= _UNITS[unit]
+            continue
+        idx = np.flatnonzero(inverse == k)
+        if idx.size == 1 or np.all(np.diff(idx) == 1):  # contiguous channel run
+            data[idx[0] : idx[-1] + 1, :] *= _UNITS[unit]
+        else:
+            data[idx, :] *= _UNITS[unit]
 
 
 def read_triggers(cnt: InputCNT) -> tuple[list, list, list, list, dict[str, list[int]]]:
@@ -175,8 +269,7 @@ def read_triggers(cnt: InputCNT) -> tuple[list, list, list, list, dict[str, list
     """
     onsets, durations, descriptions, impedances = [], [], [], []
     disconnect = dict(start=[], stop=[])
-    for k in range(cnt.get_trigger_count()):
-        code, idx, duration, condition, description, impedance = cnt.get_trigger(k)
+    for code, idx, duration, condition, description, impedance in cnt.get_triggers():
         # detect impedance measurements
         if (
             description is not None
@@ -189,13 +282,15 @@ def read_triggers(cnt: InputCNT) -> tuple[list, list, list, list, dict[str, list
             durations.append(duration)
             descriptions.append("impedance")
             continue
-        # detect amplifier disconnection
-        if condition is not None and condition.lower() == "amplifier disconnected":
-            disconnect["start"].append(idx)
-            continue
-        elif condition is not None and condition.lower() == "amplifier reconnected":
-            disconnect["stop"].append(idx)
-            continue
+        # detect amplifier disconnection, lowering the condition only once
+        if condition is not None:
+            condition_lower = condition.lower()
+            if condition_lower == "amplifier disconnected":
+                disconnect["start"].append(idx)
+                continue
+            elif condition_lower == "amplifier reconnected":
+                disconnect["stop"].append(idx)
+                continue
         # treat all the other triggers as regular event annotations, and differentiate
         # between hardware trigger and user annotations which have a non None
         # 'condition' field.
@@ -83,6 +83,12 @@ def test_read_invalid_cnt(tmp_path):
         read_cnt(tmp_path / "test.txt")
 
 
+def test_read_missing_cnt(tmp_path):
+    """Test reading a file which does not exist."""
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        read_cnt(tmp_path / "test.cnt")
+
+
 @pytest.mark.parametrize("dataset", DATASETS)
 def test_read_meas_date(dataset, meas_date_format, request):
     """Test reading the measurement date."""
@@ -204,6 +210,17 @@ def test_get_base_triggers(dataset, request):
     assert len(cnt.get_trigger(0)[5].split(" ")) == n_channels
 
 
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_get_triggers(dataset, request):
+    """Test getting all triggers at once."""
+    dataset = request.getfixturevalue(dataset)
+    cnt = read_cnt(dataset["cnt"]["short"])
+    triggers = cnt.get_triggers()
+    assert len(triggers) == cnt.get_trigger_count()
+    for k, trigger in enumerate(triggers):
+        assert trigger == cnt.get_trigger(k)
+
+
 @pytest.mark.parametrize("dataset", DATASETS)
 def test_get_invalid_triggers(dataset, request):
     """Test getting triggers from an invalid index."""
@@ -12,6 +12,7 @@ from antio.parser import (
     read_meas_date,
     read_subject_info,
     read_triggers,
+    scale_data,
 )
 
 DATASETS: list[str] = [
@@ -105,6 +106,99 @@ def test_read_data(dataset, read_raw_bv, request):
     assert_allclose(data, raw.get_data(), atol=1e-8)
 
 
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_read_data_scaled(dataset, read_raw_bv, request):
+    """Test reading the data array scaled to SI units."""
+    dataset = request.getfixturevalue(dataset)
+    cnt = read_cnt(dataset["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    data = read_data(cnt, ch_units=ch_units)
+    raw = read_raw_bv(dataset["bv"]["short"])
+    assert data.shape == raw.get_data().shape
+    assert_allclose(data, raw.get_data(), atol=1e-8)
+
+
+def test_read_data_unknown_unit(ca_208):
+    """Test reading the data array with an unrecognized unit."""
+    cnt = read_cnt(ca_208["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    ch_units[0] = "101"
+    data = read_data(cnt)
+    with pytest.warns(RuntimeWarning, match="not recognized"):
+        data_scaled = read_data(cnt, ch_units=ch_units)
+    assert_allclose(data_scaled[0, :], data[0, :])
+    assert_allclose(data_scaled[1:, :], data[1:, :] * 1e-6)
+
+
+def test_read_data_chunked(ca_208, monkeypatch):
+    """Test that block-wise reads match a single-shot read."""
+    cnt = read_cnt(ca_208["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    data = read_data(cnt)
+    data_scaled = read_data(cnt, ch_units=ch_units)
+    monkeypatch.setattr("antio.parser._CHUNK_SIZE", 64)
+    assert_allclose(read_data(cnt), data)
+    assert_allclose(read_data(cnt, ch_units=ch_units), data_scaled)
+
+
+def test_read_data_float32(ca_208, read_raw_bv):
+    """Test reading the data array in float32 precision."""
+    cnt = read_cnt(ca_208["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    data = read_data(cnt, ch_units=ch_units, dtype="float32")
+    assert data.dtype == np.float32
+    raw = read_raw_bv(ca_208["bv"]["short"])
+    assert_allclose(data, raw.get_data(), atol=1e-8)
+    data = read_data(cnt, dtype=np.float32)
+    assert data.dtype == np.float32
+    assert data.flags["C_CONTIGUOUS"]
+    assert data.flags["WRITEABLE"]
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        read_data(cnt, dtype="int16")
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_scale_data(dataset, read_raw_bv, request):
+    """Test scaling the data array to SI units."""
+    dataset = request.getfixturevalue(dataset)
+    cnt = read_cnt(dataset["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    data = read_data(cnt)
+    scale_data(data, ch_units)
+    raw = read_raw_bv(dataset["bv"]["short"])
+    assert_allclose(data, raw.get_data(), atol=1e-8)
+
+
+def test_scale_data_mixed_units(ca_208, read_raw_bv):
+    """Test scaling with mixed units, exercising the slice and fancy index paths."""
+    cnt = read_cnt(ca_208["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    raw = read_raw_bv(ca_208["bv"]["short"])
+    # contiguous run of a different but equivalent unit
+    data = read_data(cnt)
+    scale_data(data, ["µv"] * 3 + ch_units[3:])
+    assert_allclose(data, raw.get_data(), atol=1e-8)
+    # non-contiguous channels with a different but equivalent unit
+    data = read_data(cnt)
+    ch_units_mixed = ch_units.copy()
+    ch_units_mixed[0] = ch_units_mixed[2] = "µv"
+    scale_data(data, ch_units_mixed)
+    assert_allclose(data, raw.get_data(), atol=1e-8)
+
+
+def test_scale_data_unknown_unit(ca_208):
+    """Test scaling a data array with an unrecognized unit."""
+    cnt = read_cnt(ca_208["cnt"]["short"])
+    _, ch_units, _, _, _ = read_info(cnt)
+    ch_units[0] = "101"
+    data = read_data(cnt)
+    data_scaled = data.copy()
+    with pytest.warns(RuntimeWarning, match="not recognized"):
+        scale_data(data_scaled, ch_units)
+    assert_allclose(data_scaled[0, :], data[0, :])
+    assert_allclose(data_scaled[1:, :], data[1:, :] * 1e-6)
+
+
 @pytest.mark.parametrize("dataset", ["andy_101", "ca_208"])
 def test_read_triggers(dataset, read_raw_bv, request):
     """Test reading the triggers from a cnt file."""